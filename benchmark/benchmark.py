@@ -22,9 +22,16 @@ def run_benchmark(bm_path, repeats=5):
     os.chdir(f"{bm_path.parent}")
     bm_mod = importlib.import_module(f"{bm_path.stem}")
 
+    # Warm-up run (not timed) to exclude one-time costs such as
+    # library loading, numba compilation, or filling the disk cache.
+    print("Warming up...", end="\r")
+    bm_mod.setup()
+    bm_mod.main()
+
     reps = []
     print("Running...", end="\r")
     for ii in range(repeats):
+        # Note that `timeit` disables garbage collection during timing.
         t = timeit.timeit(bm_mod.main, setup=bm_mod.setup, number=1)
         reps.append(t)
         print(f"Running {ii + 1}/{repeats}", end="\r")
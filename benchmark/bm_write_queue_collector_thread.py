@@ -19,6 +19,9 @@ def setup():
     event_queue = mp.Queue()
     writer_dq = deque()
     feat_nevents = mp_spawn.Array("i", num_events)
+    # One event per frame (see `event_queue` below); set all values at
+    # once via numpy instead of element-wise through the Array proxy.
+    np.ctypeslib.as_array(feat_nevents.get_obj()).fill(1)
 
     # Create 1000 events with at most two repetitions in a frame
     np.random.seed(42)
@@ -20,6 +20,7 @@ class EventExtractorManagerThread(threading.Thread):
                  num_workers: int,
                  writer_dq: collections.deque,
                  debug: bool = False,
+                 slot_cond: threading.Condition = None,
                  *args, **kwargs):
         """Manage event extraction threads or precesses
 
@@ -48,6 +49,10 @@ class EventExtractorManagerThread(threading.Thread):
         debug:
             Whether to run in debugging mode which means only one
             event extraction thread (`num_workers` has no effect).
+        slot_cond:
+            Condition shared with the :class:`.SegmenterManagerThread`
+            which is notified whenever a slot state changes. If not set,
+            `slot_states` is polled.
         """
         super(EventExtractorManagerThread, self).__init__(
               name="EventExtractorManager", *args, **kwargs)
@@ -61,6 +66,8 @@ class EventExtractorManagerThread(threading.Thread):
         self.slot_states = slot_states
         #: Chunks indices corresponding to `slot_states`
         self.slot_chunks = slot_chunks
+        #: Condition notified when a slot state changes
+        self.slot_cond = slot_cond or threading.Condition()
         #: Number of workers
         self.num_workers = 1 if debug else num_workers
         #: Queue for sending chunks and label indices to the workers
@@ -114,7 +121,8 @@ class EventExtractorManagerThread(threading.Thread):
                 # first. Initially, the slot_chunks array is filled with
                 # zeros, but the segmenter fills up the slots with the lowest
                 # number first.
-                for cur_slot in np.argsort(self.slot_chunks):
+                for cur_slot in sorted(range(num_slots),
+                                       key=self.slot_chunks.__getitem__):
                     # - "e" there is data from the segmenter (the extractor
                     #   can take it and process it)
                     # - "s" the extractor processed the data and is waiting
@@ -128,9 +136,11 @@ class EventExtractorManagerThread(threading.Thread):
                         unavailable_slots += 1
                         cur_slot = (cur_slot + 1) % num_slots
                     if unavailable_slots >= num_slots:
-                        # There is nothing to do, try to avoid 100% CPU
+                        # There is nothing to do, wait for the segmenter
+                        # (the timeout covers a notification we missed)
                         unavailable_slots = 0
-                        time.sleep(.1)
+                        with self.slot_cond:
+                            self.slot_cond.wait(timeout=.1)
 
             t1 = time.monotonic()
 
@@ -156,6 +166,8 @@ class EventExtractorManagerThread(threading.Thread):
 
             # We are done here. The segmenter may continue its deed.
             self.slot_states[cur_slot] = "w"
+            with self.slot_cond:
+                self.slot_cond.notify_all()
 
             self.logger.debug(f"Extracted chunk {chunk} in slot {cur_slot}")
             self.t_count += time.monotonic() - t1
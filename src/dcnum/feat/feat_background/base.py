@@ -78,14 +78,25 @@ class Background(abc.ABC):
         self.h5out = None
         #: reference paths for logging to the output .rtdc file
         self.paths_ref = []
+        # The default HDF5 chunk cache (1 MiB) only holds a single
+        # image chunk (see `HDF5Writer.get_best_nd_chunks`). A larger
+        # cache avoids decompressing input chunks multiple times for
+        # strided access and read-modify-write cycles for output chunks
+        # that are written in several batches.
+        h5in_kw = dict(libver="latest",
+                       rdcc_nbytes=64 * 1024**2,
+                       rdcc_nslots=10007,
+                       )
+        # `rdcc_w0=1` evicts fully-written chunks first.
+        h5out_kw = dict(h5in_kw, rdcc_w0=1.0)
         # Check whether user passed an array or a path
         if isinstance(input_data, pathlib.Path):
             if str(input_data.resolve()) == str(output_path.resolve()):
-                self.h5in = h5py.File(input_data, "a", libver="latest")
+                self.h5in = h5py.File(input_data, "a", **h5out_kw)
                 self.h5out = self.h5in
             else:
                 self.paths_ref.append(input_data)
-                self.h5in = h5py.File(input_data, "r", libver="latest")
+                self.h5in = h5py.File(input_data, "r", **h5in_kw)
             # TODO: Properly setup HDF5 caching.
             #       Right now, we are accessing the raw h5ds property of
             #       the ImageCache. We have to go via the ImageCache route,
@@ -108,7 +119,7 @@ class Background(abc.ABC):
                 create_with_basins(path_out=output_path,
                                    basin_paths=self.paths_ref)
             # "a", because output file already exists
-            self.h5out = h5py.File(output_path, "a", libver="latest")
+            self.h5out = h5py.File(output_path, "a", **h5out_kw)
 
         # Initialize writer
         self.writer = HDF5Writer(
@@ -47,7 +47,7 @@ def brightness_features(image: np.ndarray[np.uint8],
     if image_bg is not None or image_corr is not None:
         # Background-corrected brightness values
         if image_corr is None:
-            image_corr = np.array(image, dtype=np.int16) - image_bg
+            image_corr = np.subtract(image, image_bg, dtype=np.int16)
 
         avg_sd_corr = compute_avg_sd_masked_int16(image_corr, mask)
         br_dict["bright_bc_avg"][:] = avg_sd_corr[:, 0]
@@ -1,4 +1,7 @@
+import math
+
 import cv2
+from numba import njit, prange
 import numpy as np
 
 
@@ -26,29 +29,17 @@ def moments_based_features(
 
     size = mask.shape[0]
 
-    empty = np.full(size, np.nan, dtype=np.float64)
-
-    # features from raw contour
-    feat_area_msd = np.copy(empty)
-    feat_area_ratio = np.copy(empty)
-    feat_area_um_raw = np.copy(empty)
-    feat_aspect = np.copy(empty)
-    feat_deform_raw = np.copy(empty)
-    feat_eccentr_prnc = np.copy(empty)
-    feat_inert_ratio_prnc = np.copy(empty)
-    feat_inert_ratio_raw = np.copy(empty)
-    feat_per_ratio = np.copy(empty)
-    feat_per_um_raw = np.copy(empty)
-    feat_size_x = np.copy(empty)
-    feat_size_y = np.copy(empty)
-    feat_tilt = np.copy(empty)
-
-    # features from convex hull
-    feat_area_um = np.copy(empty)
-    feat_deform = np.copy(empty)
-    feat_inert_ratio_cvx = np.copy(empty)
-    feat_pos_x = np.copy(empty)
-    feat_pos_y = np.copy(empty)
+    # The feature computation is split into two passes. In the first
+    # pass, we only call OpenCV for every mask and store the resulting
+    # scalars (moments, perimeters, bounding box) in arrays. In the
+    # second pass, all features are computed from these arrays with
+    # numba. This avoids a lot of Python overhead for scalar math.
+
+    # All scalars of the first pass are stored in the rows of one array.
+    (raw_m00, raw_mu02, raw_mu11, raw_mu20, raw_arc,  # raw contour
+     cvx_m00, cvx_m01, cvx_m10, cvx_mu02, cvx_mu20, cvx_arc,  # convex hull
+     box_w, box_h,  # bounding box
+     ) = np.full((13, size), np.nan, dtype=np.float64)
 
     # The following valid-array is not a real feature, but only
     # used to figure out which events need to be removed due
@@ -58,8 +49,12 @@ def moments_based_features(
     for ii in range(size):
         # raw contour
         cont_raw = contour_single_opencv(mask[ii])
-        # only continue if the contour is valid
-        not_valid = len(cont_raw.shape) < 2 or cv2.contourArea(cont_raw) == 0
+        # only continue if the contour is valid (the area of the
+        # contour is the zeroth moment)
+        not_valid = len(cont_raw.shape) < 2
+        if not not_valid:
+            mu_raw = contour_moments(cont_raw)
+            not_valid = mu_raw[0] == 0
 
         if ret_contour:
             raw_contours.append(None if not_valid else cont_raw)
@@ -67,70 +62,37 @@ def moments_based_features(
         if not_valid:
             continue
 
-        mu_raw = cv2.moments(cont_raw)
-        arc_raw = np.float64(cv2.arcLength(cont_raw, True))
-        area_raw = np.float64(mu_raw["m00"])
-
         # convex hull
         cont_cvx = np.squeeze(cv2.convexHull(cont_raw))
 
-        mu_cvx = cv2.moments(cont_cvx)
-        arc_cvx = np.float64(cv2.arcLength(cont_cvx, True))
+        mu_cvx = contour_moments(cont_cvx)
 
-        if mu_cvx["m00"] == 0 or mu_raw["m00"] == 0:
+        if mu_cvx[0] == 0:
             # contour size too small
             continue
 
-        # bounding box
-        x, y, w, h = cv2.boundingRect(cont_raw)
-
-        feat_area_msd[ii] = mu_raw["m00"]
-        feat_area_ratio[ii] = mu_cvx["m00"] / mu_raw["m00"]
-        feat_aspect[ii] = w / h
-        feat_area_um[ii] = mu_cvx["m00"] * pixel_size**2
-        feat_area_um_raw[ii] = area_raw * pixel_size**2
-        feat_deform[ii] = 1 - 2 * np.sqrt(np.pi * mu_cvx["m00"]) / arc_cvx
-        feat_deform_raw[ii] = 1 - 2 * np.sqrt(np.pi * area_raw) / arc_raw
-        feat_per_ratio[ii] = arc_raw / arc_cvx
-        feat_per_um_raw[ii] = arc_raw * pixel_size
-        feat_pos_x[ii] = mu_cvx["m10"] / mu_cvx["m00"] * pixel_size
-        feat_pos_y[ii] = mu_cvx["m01"] / mu_cvx["m00"] * pixel_size
-        feat_size_x[ii] = w * pixel_size
-        feat_size_y[ii] = h * pixel_size
-
-        # inert_ratio_cvx
-        if mu_cvx['mu02'] > 0:  # defaults to zero
-            feat_inert_ratio_cvx[ii] = np.sqrt(mu_cvx['mu20'] / mu_cvx['mu02'])
-
-        # moments of inertia of raw contour
-        i_xx = np.float64(mu_raw["mu02"])
-        i_yy = np.float64(mu_raw["mu20"])
-        i_xy = np.float64(mu_raw["mu11"])
-
-        # tilt
-        feat_tilt[ii] = np.abs(0.5 * np.arctan2(-2 * i_xy, i_yy - i_xx))
-
-        # inert_ratio_raw
-        if i_xx > 0:  # defaults to zero
-            feat_inert_ratio_raw[ii] = np.sqrt(i_yy / i_xx)
-
-        # central moments in principal axes
-        i_root_1 = (i_xx - i_yy) ** 2 + 4*(i_xy ** 2)
-        i_root_2 = (i_xx - i_yy) ** 2 + 4*(i_xy ** 2)
+        raw_m00[ii], _, _, raw_mu02[ii], raw_mu11[ii], raw_mu20[ii] = mu_raw
+        raw_arc[ii] = cv2.arcLength(cont_raw, True)
 
-        # inert_ratio_prnc and eccentr_prnc
-        if i_root_1 >= 0 and i_root_2 >= 0:
-            i_1 = 0.5 * (i_xx + i_yy + np.sqrt(i_root_1))
-            i_2 = 0.5 * (i_xx + i_yy - np.sqrt(i_root_2))
-            i_ratio = i_1 / i_2
-            if i_ratio >= 0:
-                feat_inert_ratio_prnc[ii] = np.sqrt(i_ratio)
+        cvx_m00[ii], cvx_m01[ii], cvx_m10[ii], cvx_mu02[ii], _, \
+            cvx_mu20[ii] = mu_cvx
+        cvx_arc[ii] = cv2.arcLength(cont_cvx, True)
 
-            feat_eccentr_prnc[ii] = np.sqrt((i_1 - i_2) / i_1)
+        # bounding box
+        _, _, box_w[ii], box_h[ii] = cv2.boundingRect(cont_raw)
 
         # specify validity
         valid[ii] = True
 
+    (feat_area_msd, feat_area_ratio, feat_area_um, feat_area_um_raw,
+     feat_aspect, feat_deform, feat_deform_raw, feat_eccentr_prnc,
+     feat_inert_ratio_cvx, feat_inert_ratio_prnc, feat_inert_ratio_raw,
+     feat_per_ratio, feat_per_um_raw, feat_pos_x, feat_pos_y, feat_size_x,
+     feat_size_y, feat_tilt) = compute_features_from_moments(
+        raw_m00, raw_mu02, raw_mu11, raw_mu20, raw_arc,
+        cvx_m00, cvx_m01, cvx_m10, cvx_mu02, cvx_mu20, cvx_arc,
+        box_w, box_h, valid, pixel_size)
+
     data = {
         "area_msd": feat_area_msd,
         "area_ratio": feat_area_ratio,
@@ -155,3 +117,149 @@ def moments_based_features(
     if ret_contour:
         data["contour"] = raw_contours
     return data
+
+
+@njit(cache=True)
+def contour_moments(cont):
+    """Compute spatial and central moments of a polygon contour
+
+    This is a numba implementation of the Green's theorem formulas
+    used by :func:`cv2.moments` for contours, avoiding the overhead
+    of calling OpenCV for small contours.
+
+    Parameters
+    ----------
+    cont: np.ndarray
+        2D array of shape (N, 2) with the x and y coordinates
+        of the contour points
+
+    Returns
+    -------
+    m00, m01, m10, mu02, mu11, mu20: float
+        the moments with the same values as returned by OpenCV
+    """
+    a00 = a10 = a01 = a20 = a11 = a02 = 0.
+    xi_1 = float(cont[-1, 0])
+    yi_1 = float(cont[-1, 1])
+    for ii in range(cont.shape[0]):
+        xi = float(cont[ii, 0])
+        yi = float(cont[ii, 1])
+        dxy = xi_1 * yi - xi * yi_1
+        xii_1 = xi_1 + xi
+        yii_1 = yi_1 + yi
+        a00 += dxy
+        a10 += dxy * xii_1
+        a01 += dxy * yii_1
+        a20 += dxy * (xi_1 * xii_1 + xi * xi)
+        a11 += dxy * (xi_1 * (yii_1 + yi_1) + xi * (yii_1 + yi))
+        a02 += dxy * (yi_1 * yii_1 + yi * yi)
+        xi_1 = xi
+        yi_1 = yi
+
+    if abs(a00) <= np.finfo(np.float32).eps:
+        return 0., 0., 0., 0., 0., 0.
+
+    # normalize the orientation of the contour
+    sign = 1. if a00 > 0 else -1.
+    m00 = a00 * sign * 0.5
+    m10 = a10 * sign * 0.16666666666666666
+    m01 = a01 * sign * 0.16666666666666666
+    m20 = a20 * sign * 0.08333333333333333
+    m11 = a11 * sign * 0.041666666666666664
+    m02 = a02 * sign * 0.08333333333333333
+
+    inv_m00 = 1. / m00
+    cx = m10 * inv_m00
+    cy = m01 * inv_m00
+    return m00, m01, m10, m02 - m01 * cy, m11 - m10 * cy, m20 - m10 * cx
+
+
+@njit(cache=True, error_model="numpy")
+def compute_features_from_moments(raw_m00, raw_mu02, raw_mu11, raw_mu20,
+                                  raw_arc, cvx_m00, cvx_m01, cvx_m10,
+                                  cvx_mu02, cvx_mu20, cvx_arc, box_w, box_h,
+                                  valid, pixel_size):
+    """Compute moments-based features from contour moments
+
+    All array arguments are 1D arrays with one entry per event.
+    Features of events that are not `valid` are set to NaN.
+    The features are returned in alphabetical order of their names
+    (see `moments_based_features`).
+    """
+    size = valid.size
+    # All features are stored in the rows of one array.
+    out = np.full((18, size), np.nan)
+    feat_area_msd = out[0]
+    feat_area_ratio = out[1]
+    feat_area_um = out[2]
+    feat_area_um_raw = out[3]
+    feat_aspect = out[4]
+    feat_deform = out[5]
+    feat_deform_raw = out[6]
+    feat_eccentr_prnc = out[7]
+    feat_inert_ratio_cvx = out[8]
+    feat_inert_ratio_prnc = out[9]
+    feat_inert_ratio_raw = out[10]
+    feat_per_ratio = out[11]
+    feat_per_um_raw = out[12]
+    feat_pos_x = out[13]
+    feat_pos_y = out[14]
+    feat_size_x = out[15]
+    feat_size_y = out[16]
+    feat_tilt = out[17]
+
+    for ii in prange(size):
+        if not valid[ii]:
+            continue
+        # features from raw contour
+        feat_area_msd[ii] = raw_m00[ii]
+        feat_area_ratio[ii] = cvx_m00[ii] / raw_m00[ii]
+        feat_area_um_raw[ii] = raw_m00[ii] * pixel_size**2
+        feat_aspect[ii] = box_w[ii] / box_h[ii]
+        feat_deform_raw[ii] = \
+            1 - 2 * math.sqrt(math.pi * raw_m00[ii]) / raw_arc[ii]
+        feat_per_ratio[ii] = raw_arc[ii] / cvx_arc[ii]
+        feat_per_um_raw[ii] = raw_arc[ii] * pixel_size
+        feat_size_x[ii] = box_w[ii] * pixel_size
+        feat_size_y[ii] = box_h[ii] * pixel_size
+
+        # features from convex hull
+        feat_area_um[ii] = cvx_m00[ii] * pixel_size**2
+        feat_deform[ii] = \
+            1 - 2 * math.sqrt(math.pi * cvx_m00[ii]) / cvx_arc[ii]
+        feat_pos_x[ii] = cvx_m10[ii] / cvx_m00[ii] * pixel_size
+        feat_pos_y[ii] = cvx_m01[ii] / cvx_m00[ii] * pixel_size
+
+        # inert_ratio_cvx
+        if cvx_mu02[ii] > 0:  # defaults to zero
+            feat_inert_ratio_cvx[ii] = math.sqrt(cvx_mu20[ii] / cvx_mu02[ii])
+
+        # moments of inertia of raw contour
+        i_xx = raw_mu02[ii]
+        i_yy = raw_mu20[ii]
+        i_xy = raw_mu11[ii]
+
+        # tilt
+        feat_tilt[ii] = abs(0.5 * math.atan2(-2 * i_xy, i_yy - i_xx))
+
+        # inert_ratio_raw
+        if i_xx > 0:  # defaults to zero
+            feat_inert_ratio_raw[ii] = math.sqrt(i_yy / i_xx)
+
+        # central moments in principal axes
+        i_root = math.sqrt((i_xx - i_yy) ** 2 + 4 * (i_xy ** 2))
+
+        # inert_ratio_prnc and eccentr_prnc
+        i_1 = 0.5 * (i_xx + i_yy + i_root)
+        i_2 = 0.5 * (i_xx + i_yy - i_root)
+        i_ratio = i_1 / i_2
+        if i_ratio >= 0:
+            feat_inert_ratio_prnc[ii] = math.sqrt(i_ratio)
+
+        feat_eccentr_prnc[ii] = math.sqrt((i_1 - i_2) / i_1)
+
+    return (feat_area_msd, feat_area_ratio, feat_area_um, feat_area_um_raw,
+            feat_aspect, feat_deform, feat_deform_raw, feat_eccentr_prnc,
+            feat_inert_ratio_cvx, feat_inert_ratio_prnc, feat_inert_ratio_raw,
+            feat_per_ratio, feat_per_um_raw, feat_pos_x, feat_pos_y,
+            feat_size_x, feat_size_y, feat_tilt)
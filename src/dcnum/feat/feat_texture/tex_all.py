@@ -41,7 +41,7 @@ def haralick_texture_features(
     # compute features if necessary
     if image_bg is not None and image is not None and image_corr is None:
         # Background-corrected brightness values
-        image_corr = np.array(image, dtype=np.int16) - image_bg
+        image_corr = np.subtract(image, image_bg, dtype=np.int16)
 
     tex_dict = {}
     empty = np.full(size, np.nan, dtype=np.float64)
@@ -718,6 +718,8 @@ class DCNumJobRunner(threading.Thread):
         self.job.kwargs["segmenter_kwargs"]["debug"] = self.job["debug"]
         slot_chunks = mp_spawn.Array("i", num_slots, lock=False)
         slot_states = mp_spawn.Array("u", num_slots, lock=False)
+        # Notified by the segmenter and the extractor on slot state changes
+        slot_cond = threading.Condition()
 
         self.logger.debug(f"Number of slots: {num_slots}")
         self.logger.debug(f"Number of segmenters: {num_segmenters}")
@@ -730,6 +732,7 @@ class DCNumJobRunner(threading.Thread):
             bg_off=self.dtin["bg_off"] if "bg_off" in self.dtin else None,
             slot_states=slot_states,
             slot_chunks=slot_chunks,
+            slot_cond=slot_cond,
         )
         thr_segm.start()
 
@@ -750,7 +753,8 @@ class DCNumJobRunner(threading.Thread):
             num_workers=num_extractors,
             labels_list=thr_segm.labels_list,
             writer_dq=writer_dq,
-            debug=self.job["debug"])
+            debug=self.job["debug"],
+            slot_cond=slot_cond)
         thr_feat.start()
 
         # Start the data collection thread
@@ -832,11 +836,11 @@ def join_thread_helper(thr, timeout, retries, logger, name):
     for _ in range(retries):
         thr.join(timeout=timeout)
         if thr.is_alive():
-            logger.info(f"Waiting for '{name}' ({thr}")
+            logger.info(f"Waiting for '{name}' ({thr})")
         else:
             logger.debug(f"Joined thread '{name}'")
             break
     else:
         logger.error(f"Failed to join thread '{name}'")
-        raise ValueError(f"Thread '{name}' ({thr}) did not join"
+        raise ValueError(f"Thread '{name}' ({thr}) did not join "
                          f"within {timeout * retries}s!")
@@ -1,8 +1,9 @@
 import abc
-import collections
+from concurrent.futures import ThreadPoolExecutor
 import functools
 import hashlib
 import pathlib
+import threading
 from typing import Tuple
 import warnings
 
@@ -25,8 +26,17 @@ class BaseImageChunkCache(abc.ABC):
         self._dtype = None
         chunk_size = min(shape[0], chunk_size)
         self._len = self.shape[0]
-        #: This is a FILO cache for the chunks
-        self.cache = collections.OrderedDict()
+        #: This is a FIFO cache for the chunks
+        self.cache = {}
+        # Ring buffer with the chunk indices in `self.cache`; the entry
+        # at `self._cache_next` is the oldest and will be evicted next.
+        self._cache_ring = [None] * cache_size
+        self._cache_next = 0
+        self._cache_lock = threading.Lock()
+        #: Chunk index and future of the chunk loaded in the background
+        #: (see `prefetch_chunk`); not part of the FIFO cache above
+        self._prefetch = None
+        self._prefetch_pool = None
         self.image_shape = self.shape[1:]
         self.chunk_shape = (chunk_size,) + self.shape[1:]
         self.chunk_size = chunk_size
@@ -79,13 +89,22 @@ class BaseImageChunkCache(abc.ABC):
 
     def get_chunk(self, chunk_index):
         """Return one chunk of images"""
-        if chunk_index not in self.cache:
-            if len(self.cache) >= self.cache_size:
-                # Remove the first item
-                self.cache.popitem(last=False)
-            data = self._get_chunk_data(self.get_chunk_slice(chunk_index))
-            self.cache[chunk_index] = data
-        return self.cache[chunk_index]
+        with self._cache_lock:
+            if chunk_index not in self.cache:
+                # Remove the oldest item
+                old_index = self._cache_ring[self._cache_next]
+                if old_index is not None:
+                    del self.cache[old_index]
+                if self._prefetch and self._prefetch[0] == chunk_index:
+                    data = self._prefetch[1].result()
+                    self._prefetch = None
+                else:
+                    data = self._get_chunk_data(
+                        self.get_chunk_slice(chunk_index))
+                self.cache[chunk_index] = data
+                self._cache_ring[self._cache_next] = chunk_index
+                self._cache_next = (self._cache_next + 1) % self.cache_size
+            return self.cache[chunk_index]
 
     def get_chunk_size(self, chunk_index):
         """Return the number of images in this chunk"""
@@ -104,10 +123,39 @@ class BaseImageChunkCache(abc.ABC):
                          )
         return ch_slice
 
-    def iter_chunks(self):
+    def prefetch_chunk(self, chunk_index):
+        """Load a chunk in a background thread
+
+        The chunk is only moved to the FIFO cache when it is requested
+        via `get_chunk`, so prefetching never evicts chunks that are
+        still in use. Only the most recently prefetched chunk is kept.
+        """
+        with self._cache_lock:
+            if (chunk_index >= self.num_chunks
+                    or chunk_index in self.cache
+                    or (self._prefetch and self._prefetch[0] == chunk_index)):
+                return
+            if self._prefetch_pool is None:
+                self._prefetch_pool = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="ImageChunkPrefetch")
+            self._prefetch = (
+                chunk_index,
+                self._prefetch_pool.submit(self._get_chunk_data,
+                                           self.get_chunk_slice(chunk_index))
+            )
+
+    def iter_chunks(self, prefetch: bool = False):
+        """Iterate over the chunk indices
+
+        If `prefetch` is set, then the next chunk is loaded in a
+        background thread while the caller processes the current one.
+        """
         index = 0
         chunk = 0
         while True:
+            if prefetch:
+                self.prefetch_chunk(chunk + 1)
             yield chunk
             chunk += 1
             index += self.chunk_size
@@ -129,14 +177,18 @@ class HDF5ImageCache(BaseImageChunkCache):
         loaded, decompressed and from that one image extracted. The
         `HDF5ImageCache` class caches the chunks from the HDF5 files
         into memory, making single-image-access very fast.
+
+        If `h5ds` is chunked, then `chunk_size` is rounded to the
+        nearest multiple of the HDF5 chunk size along the first axis,
+        so that no HDF5 chunk has to be decompressed twice.
         """
+        h5chunks = getattr(h5ds, "chunks", None)
+        if h5chunks:
+            chunk_size = max(1, round(chunk_size / h5chunks[0])) * h5chunks[0]
         super(HDF5ImageCache, self).__init__(
             shape=h5ds.shape,
             chunk_size=chunk_size,
             cache_size=cache_size)
-        # TODO:
-        # - adjust chunking to multiples of the chunks in the dataset
-        #   (which might slightly speed up things)
         self.h5ds = h5ds
         self.boolean = boolean
 
@@ -148,7 +200,12 @@ class HDF5ImageCache(BaseImageChunkCache):
     def _get_chunk_data(self, chunk_slice):
         data = self.h5ds[chunk_slice]
         if self.boolean:
-            data = np.array(data, dtype=bool)
+            if data.dtype == np.uint8:
+                # Masks are stored as uint8 (0 or 255); convert in-place
+                # instead of allocating a second chunk-sized array.
+                data = np.not_equal(data, 0, out=data.view(bool))
+            elif data.dtype != bool:
+                data = np.array(data, dtype=bool)
         return data
 
 
@@ -164,9 +221,11 @@ class ImageCorrCache(BaseImageChunkCache):
         self.image_bg = image_bg
 
     def _get_chunk_data(self, chunk_slice):
-        data = np.array(
-            self.image._get_chunk_data(chunk_slice), dtype=np.int16) \
-           - self.image_bg._get_chunk_data(chunk_slice)
+        image = self.image._get_chunk_data(chunk_slice)
+        image_bg = self.image_bg._get_chunk_data(chunk_slice)
+        # Widen to int16 and subtract in one pass (no temporary int16 copy)
+        data = np.empty(image.shape, dtype=np.int16)
+        np.subtract(image, image_bg, out=data, dtype=np.int16)
         return data
 
 
@@ -180,17 +239,24 @@ def md5sum(path, blocksize=65536, count=0):
         path to the file
     blocksize: int
         block size in bytes read from the file
-        (set to `0` to hash the entire file)
     count: int
         number of blocks read from the file
+        (set to `0` to hash the entire file)
     """
     path = pathlib.Path(path)
 
-    hasher = hashlib.md5()
     with path.open('rb') as fd:
+        if count == 0 and hasattr(hashlib, "file_digest"):
+            # Python 3.11+ hashes the entire file without Python overhead
+            return hashlib.file_digest(fd, "md5").hexdigest()
+
+        hasher = hashlib.md5()
+        # Read into the same buffer to avoid allocating new bytes objects
+        buf = bytearray(blocksize)
+        view = memoryview(buf)
         ii = 0
-        while len(buf := fd.read(blocksize)) > 0:
-            hasher.update(buf)
+        while (size := fd.readinto(buf)) > 0:
+            hasher.update(view[:size])
             ii += 1
             if count and ii == count:
                 break
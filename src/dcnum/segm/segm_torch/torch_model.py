@@ -1,6 +1,5 @@
 import errno
 import functools
-import hashlib
 import json
 import logging
 import os
@@ -9,6 +8,7 @@ import pathlib
 import torch
 
 from ...meta import paths
+from ...read import md5sum
 
 
 logger = logging.getLogger(__name__)
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 def check_md5sum(path):
     """Verify the last five characters of the file stem with its MD5 hash"""
-    md5 = hashlib.md5(path.read_bytes()).hexdigest()
+    md5 = md5sum(path)
     if md5[:5] != path.stem.split("_")[-1]:
         raise ValueError(f"MD5 mismatch for {path} ({md5})! Expected the "
                          f"input file to end with '{md5[:5]}{path.suffix}'.")
@@ -18,6 +18,7 @@ class SegmenterManagerThread(threading.Thread):
                  slot_states: mp.Array,
                  slot_chunks: mp.Array,
                  bg_off: np.ndarray = None,
+                 slot_cond: threading.Condition = None,
                  *args, **kwargs):
         """Manage the segmentation of image data
 
@@ -42,6 +43,10 @@ class SegmenterManagerThread(threading.Thread):
             1d array containing additional background image offset values
             that are added to each background image before subtraction
             from the input image
+        slot_cond:
+            Condition shared with the :class:`.EventExtractorManagerThread`
+            which is notified whenever a slot state changes. If not set,
+            `slot_states` is polled.
 
         Notes
         -----
@@ -72,6 +77,8 @@ class SegmenterManagerThread(threading.Thread):
         self.slot_states = slot_states
         #: Current slot chunk index for the slot states
         self.slot_chunks = slot_chunks
+        #: Condition notified when a slot state changes
+        self.slot_cond = slot_cond or threading.Condition()
         #: List containing the segmented labels of each slot
         self.labels_list = [None] * len(self.slot_states)
         #: Time counter for segmentation
@@ -80,7 +87,7 @@ class SegmenterManagerThread(threading.Thread):
     def run(self):
         num_slots = len(self.slot_states)
         # We iterate over all the chunks of the image data.
-        for chunk in self.image_data.iter_chunks():
+        for chunk in self.image_data.iter_chunks(prefetch=True):
             unavailable_slots = 0
             found_free_slot = False
             # Wait for a free slot to perform segmentation (compute labels)
@@ -89,7 +96,8 @@ class SegmenterManagerThread(threading.Thread):
                 # always process the slot with the smallest slot chunk number
                 # first. Initially, the slot_chunks array is filled with
                 # zeros, but we populate it here.
-                for cur_slot in np.argsort(self.slot_chunks):
+                for cur_slot in sorted(range(num_slots),
+                                       key=self.slot_chunks.__getitem__):
                     # - "e" there is data from the segmenter (the extractor
                     #   can take it and process it)
                     # - "s" the extractor processed the data and is waiting
@@ -103,9 +111,11 @@ class SegmenterManagerThread(threading.Thread):
                         # Try another slot.
                         unavailable_slots += 1
                     if unavailable_slots >= num_slots:
-                        # There is nothing to do, try to avoid 100% CPU
+                        # There is nothing to do, wait for the extractor
+                        # (the timeout covers a notification we missed)
                         unavailable_slots = 0
-                        time.sleep(.1)
+                        with self.slot_cond:
+                            self.slot_cond.wait(timeout=.1)
 
             t1 = time.monotonic()
 
@@ -124,6 +134,8 @@ class SegmenterManagerThread(threading.Thread):
             # This must be done last: Let the extractor know that this
             # slot is ready for processing.
             self.slot_states[cur_slot] = "e"
+            with self.slot_cond:
+                self.slot_cond.notify_all()
             self.logger.debug(f"Segmented chunk {chunk} in slot {cur_slot}")
 
             self.t_count += time.monotonic() - t1
@@ -68,6 +68,10 @@ class MPOSegmenter(Segmenter, abc.ABC):
         # Tells the workers to stop
         # (raw value, because only this thread changes it)
         self.mp_shutdown = mp_spawn.RawValue("i", 0)
+        # Number of images in the current batch (may be smaller than
+        # the size of the shared arrays, e.g. for the last chunk)
+        # (raw value, because only this thread changes it)
+        self.mp_batch_size = mp_spawn.RawValue("i", 0)
 
     def __enter__(self):
         return self
@@ -170,19 +174,17 @@ class MPOSegmenter(Segmenter, abc.ABC):
             stop = len(images)
 
         batch_size = stop - start
-        size = np.prod(images.shape[1:]) * batch_size
 
         if self.image_shape is None:
             self.image_shape = images[0].shape
 
-        if self._mp_image_np is not None and self._mp_image_np.size != size:
-            # reset image data
+        if (self._mp_image_np is not None
+                and self._mp_image_np.shape[0] < batch_size):
+            # Reset image data. Smaller batches (e.g. the final rest of
+            # a dataset) reuse the shared arrays and the workers.
             self._mp_image_np = None
             self._mp_labels_np = None
             self._mp_bg_off_np = None
-            # TODO: If only the batch_size changes, don't
-            #  reinitialize the workers. Otherwise, the final rest of
-            #  analyzing a dataset would always take a little longer.
             self.join_workers()
             self._mp_workers = []
             self.mp_batch_index.value = -1
@@ -199,10 +201,10 @@ class MPOSegmenter(Segmenter, abc.ABC):
             if self._mp_bg_off_np is None:
                 self.mp_bg_off_raw, self._mp_bg_off_np = \
                     self._create_shared_array(
-                        array_shape=(stop - start,),
+                        array_shape=(),
                         batch_size=batch_size,
                         dtype=np.float64)
-            self._mp_bg_off_np[:] = bg_off[start:stop]
+            self._mp_bg_off_np[:batch_size] = bg_off[start:stop]
 
         # input images
         if self._mp_image_np is None:
@@ -211,7 +213,7 @@ class MPOSegmenter(Segmenter, abc.ABC):
                 batch_size=batch_size,
                 dtype=images.dtype,
             )
-        self._mp_image_np[:] = images[start:stop]
+        self._mp_image_np[:batch_size] = images[start:stop]
 
         # output labels
         if self._mp_labels_np is None:
@@ -248,17 +250,24 @@ class MPOSegmenter(Segmenter, abc.ABC):
                 self._mp_workers.append(w)
                 wstart = wstop
 
-        # Match iteration number with workers
-        self.mp_batch_index.value += 1
+        num_workers = len(self._mp_workers)
+
+        # Tell the workers how many images to process
+        self.mp_batch_size.value = batch_size
 
-        # Tell workers to get going
+        # Reset the counter of finished workers. This must happen before
+        # the workers are started, because workers that have nothing to
+        # do in a smaller batch finish immediately.
         self.mp_batch_worker.value = 0
 
+        # Match iteration number with workers (tell workers to get going)
+        self.mp_batch_index.value += 1
+
         # Wait for all workers to complete
         while self.mp_batch_worker.value != num_workers:
             time.sleep(.01)
 
-        return self._mp_labels_np
+        return self._mp_labels_np[:batch_size]
 
     def segment_single(self, image, bg_off: float = None):
         """Return the integer label image for an input image
@@ -315,6 +324,8 @@ class MPOSegmenterWorker:
         self.batch_worker = segmenter.mp_batch_worker
         # Shutdown bit tells workers to stop when set to != 0
         self.shutdown = segmenter.mp_shutdown
+        # Number of images in the current batch
+        self.batch_size = segmenter.mp_batch_size
         # The image data for segmentation
         self.image_arr_raw = segmenter.mp_image_raw
         # Background data offset
@@ -346,7 +357,7 @@ class MPOSegmenterWorker:
         while True:
             correct_iter = self.batch_index.value == itr
             if correct_iter:
-                if idx == self.sl_stop:
+                if idx >= min(self.sl_stop, self.batch_size.value):
                     # We finished processing everything.
                     itr += 1  # prevent running same things again
                     idx = self.sl_start  # reset counter for next batch
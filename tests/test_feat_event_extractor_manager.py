@@ -2,6 +2,7 @@ import collections
 import logging
 import multiprocessing as mp
 import queue
+import threading
 
 from dcnum.feat import (
     EventExtractorManagerThread, Gate, QueueEventExtractor
@@ -25,6 +26,7 @@ def test_event_extractor_manager_thread():
 
     slot_chunks = mp_spawn.Array("i", 1)
     slot_states = mp_spawn.Array("u", 1)
+    slot_cond = threading.Condition()
 
     thr_segm = SegmenterManagerThread(
         segmenter=SegmentThresh(
@@ -33,6 +35,7 @@ def test_event_extractor_manager_thread():
         image_data=hd.image_corr,
         slot_states=slot_states,
         slot_chunks=slot_chunks,
+        slot_cond=slot_cond,
     )
     thr_segm.start()
 
@@ -51,7 +54,8 @@ def test_event_extractor_manager_thread():
         num_workers=1,
         labels_list=thr_segm.labels_list,
         writer_dq=collections.deque(),
-        debug=True)
+        debug=True,
+        slot_cond=slot_cond)
     thr_feat.run()
     thr_segm.join()
 
@@ -1,3 +1,4 @@
+import cv2
 import h5py
 import numpy as np
 import scipy.ndimage as ndi
@@ -7,6 +8,20 @@ from dcnum.feat import feat_contour
 from helper_methods import retrieve_data
 
 
+def test_contour_moments():
+    """Moments must be identical to those computed by OpenCV"""
+    rng = np.random.default_rng(42)
+    for ii in range(50):
+        cont = rng.integers(0, 400, size=(rng.integers(3, 100), 2),
+                            dtype=np.int32)
+        if ii % 2:
+            cont = np.squeeze(cv2.convexHull(cont))
+        mu = cv2.moments(cont)
+        assert feat_contour.moments.contour_moments(cont) == (
+            mu["m00"], mu["m01"], mu["m10"], mu["mu02"], mu["mu11"],
+            mu["mu20"])
+
+
 def test_inert_ratio_prnc():
     """Test tilt and equivalence of inert_ratio_raw and inert_ratio_prnc"""
     t = np.linspace(0, 2*np.pi, 3000)
@@ -35,7 +35,7 @@ def test_join_basic_timeout_error():
     thr = threading.Thread(target=lambda: time.sleep(2))
     thr.start()
     logger = logging.getLogger(__name__)
-    with pytest.raises(ValueError, match="did not join"):
+    with pytest.raises(ValueError, match="did not join within"):
         ctrl.join_thread_helper(thr=thr,
                                 timeout=.1,
                                 retries=1,
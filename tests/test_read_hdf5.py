@@ -1,3 +1,4 @@
+import hashlib
 import pickle
 
 import h5py
@@ -106,6 +107,49 @@ def test_image_cache(tmp_path):
         assert 2 in hic.cache
 
 
+@pytest.mark.parametrize("chunk_size, h5chunk, result", [
+    (100, 30, 90),
+    (100, 40, 80),
+    (100, 200, 200),
+    (10, 30, 30),
+    (1000, 30, 400),  # limited by dataset size
+])
+def test_image_cache_chunk_size_aligned(chunk_size, h5chunk, result,
+                                        tmp_path):
+    path = tmp_path / "test.hdf5"
+    with h5py.File(path, "w") as hw:
+        hw.create_dataset("events/image",
+                          data=np.random.rand(400, 8, 18),
+                          chunks=(h5chunk, 8, 18))
+    with h5py.File(path, "r") as h5:
+        hic = read.HDF5ImageCache(h5["events/image"],
+                                  chunk_size=chunk_size)
+        assert hic.chunk_size == result
+        assert np.all(hic.get_chunk(1) == h5["events/image"][result:2*result])
+
+
+def test_image_corr_cache(tmp_path):
+    path = tmp_path / "test.hdf5"
+    image = np.random.randint(0, 256, size=(210, 80, 180), dtype=np.uint8)
+    image_bg = np.random.randint(0, 256, size=(210, 80, 180), dtype=np.uint8)
+    with h5py.File(path, "w") as hw:
+        hw["events/image"] = image
+        hw["events/image_bg"] = image_bg
+
+    with h5py.File(path, "r") as h5:
+        icc = read.cache.ImageCorrCache(
+            image=read.HDF5ImageCache(h5["events/image"], chunk_size=100),
+            image_bg=read.HDF5ImageCache(h5["events/image_bg"],
+                                         chunk_size=100),
+        )
+        image_corr = np.array(image, dtype=np.int16) - image_bg
+        chunk = icc.get_chunk(2)
+        assert chunk.dtype == np.int16
+        assert np.all(chunk == image_corr[200:])
+        assert np.all(icc[10] == image_corr[10])
+        assert np.all(icc[:] == image_corr)
+
+
 def test_image_cache_slice_out_of_bounds(tmp_path):
     path = tmp_path / "test.hdf5"
     with h5py.File(path, "w") as hw:
@@ -168,6 +212,40 @@ def test_image_cache_iter_chunks(size, chunks, tmp_path):
         assert list(hic.iter_chunks()) == list(range(chunks))
 
 
+@pytest.mark.parametrize("dtype", [np.uint8, bool])
+def test_image_cache_boolean(dtype, tmp_path):
+    path = tmp_path / "test.hdf5"
+    mask = np.random.rand(25, 80, 180) > .5
+    with h5py.File(path, "w") as hw:
+        hw["events/mask"] = np.array(mask * 255 if dtype == np.uint8
+                                     else mask, dtype=dtype)
+    with h5py.File(path, "r") as h5:
+        hic = read.HDF5ImageCache(h5["events/mask"],
+                                  chunk_size=10,
+                                  boolean=True)
+        assert hic.dtype == bool
+        assert np.all(hic[:] == mask)
+        assert np.sum(hic.get_chunk(1)) == np.sum(mask[10:20])
+
+
+def test_image_cache_iter_chunks_prefetch(tmp_path):
+    path = tmp_path / "test.hdf5"
+    data = np.random.rand(35, 80, 180)
+    with h5py.File(path, "w") as hw:
+        hw["events/image"] = data
+    with h5py.File(path, "r") as h5:
+        hic = read.HDF5ImageCache(h5["events/image"],
+                                  chunk_size=10,
+                                  cache_size=2)
+        for chunk in hic.iter_chunks(prefetch=True):
+            # the next chunk is prefetched, but not in the cache yet
+            assert hic._prefetch[0] == chunk + 1 or chunk == 3
+            assert chunk + 1 not in hic.cache
+            assert np.all(hic.get_chunk(chunk)
+                          == data[hic.get_chunk_slice(chunk)])
+        assert sorted(hic.cache.keys()) == [2, 3]
+
+
 @pytest.mark.parametrize("index_mapping,result_data", [
     [2, [0, 1]],
     [slice(1, 10, 2), [1, 3, 5, 7, 9]],
@@ -197,6 +275,21 @@ def test_keyerror_when_image_is_none(tmp_path):
         _ = h5dat["image"]
 
 
+@pytest.mark.parametrize("blocksize,count", [
+    (65536, 0),
+    (65536, 1),
+    (1000, 3),
+    (10, 0),
+])
+def test_md5sum(blocksize, count, tmp_path):
+    path = tmp_path / "data.bin"
+    data = np.random.bytes(100_000)
+    path.write_bytes(data)
+    size = blocksize * count if count else len(data)
+    assert read.md5sum(path, blocksize=blocksize, count=count) \
+        == hashlib.md5(data[:size]).hexdigest()
+
+
 def test_meta_nest():
     path = retrieve_data(
         "fmt-hdf5_cytoshot_full-features_legacy_allev_2023.zip")
@@ -316,6 +316,30 @@ def test_segm_mpo_segment_chunk():
         assert not np.all(labels_2 == 0)
 
 
+@pytest.mark.parametrize("debug", [True, False])
+def test_segm_mpo_segment_batch_smaller_reuse_workers(debug):
+    img = np.zeros((20, 20), dtype=int)
+    img[5:10, 5:10] = -20
+    images = np.array([img, np.roll(img, 2), np.roll(img, 4), img])
+    bg_off = np.array([1.5, 0.9, 1.1, 2.0])
+    with segm.segm_thresh.SegmentThresh(
+            thresh=-12,
+            kwargs_mask={"closing_disk": 0},
+            num_workers=2,
+            debug=debug,
+    ) as sm:
+        labels_1 = np.copy(sm.segment_batch(images, bg_off=bg_off))
+        workers = list(sm._mp_workers)
+        # smaller batch (e.g. the end of a dataset)
+        labels_2 = np.copy(sm.segment_batch(images[1:], bg_off=bg_off[1:]))
+        assert sm._mp_workers == workers
+        assert labels_2.shape == (3, 20, 20)
+        assert np.all(labels_2 == labels_1[1:])
+        # larger batch again
+        labels_3 = np.copy(sm.segment_batch(images, bg_off=bg_off))
+        assert np.all(labels_3 == labels_1)
+
+
 def test_cpu_segmenter_getsetstate():
     sm1 = segm.segm_thresh.SegmentThresh(thresh=-12, debug=True)
     with segm.segm_thresh.SegmentThresh(thresh=-12, debug=True) as sm2: